@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from copy import deepcopy
+from inspect import isclass
 from pathlib import Path
-from typing import Any
+from stat import S_ISDIR
+from typing import Any, get_args
 
 from pydantic import (
     BaseModel,
@@ -11,17 +14,49 @@ from pydantic import (
     model_validator,
 )
 
-from ._defs import BrandLightDark
-from ._utils import find_project_brand_yml, recurse_dicts_and_models
+from ._defs import BrandLightDark, skip_circular_reference_check
+from ._utils import (
+    find_project_brand_yml,
+    model_construct_recursive,
+    recurse_dicts_and_models,
+)
 from ._utils_yaml import yaml_brand as yaml
+from ._utils_yaml import yaml_load_data, yaml_load_file_entry
 from .base import BrandBase
-from .color import BrandColor
+from .color import BrandColor, theme_color_fields
 from .file import FileLocation, FileLocationLocal, FileLocationUrl
 from .logo import BrandLogo, BrandLogoResource
 from .meta import BrandMeta
 from .typography import BrandTypography
 
 
+def _find_typography_color_fields() -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """
+    Find the typography properties that accept colors.
+
+    Returns `(field, color_fields)` pairs for each field in `BrandTypography`
+    whose model has `color` or `background_color` fields. Computed once so that
+    resolving typography colors doesn't need to inspect the models each time.
+    """
+    fields = []
+    for name, field in BrandTypography.model_fields.items():
+        for model in get_args(field.annotation):
+            if not (isclass(model) and issubclass(model, BaseModel)):
+                continue
+            color_fields = tuple(
+                f
+                for f in model.model_fields.keys()
+                if f in ("color", "background_color")
+            )
+            if color_fields:
+                fields.append((name, color_fields))
+
+    return tuple(fields)
+
+
+_typography_color_fields = _find_typography_color_fields()
+
+
 class Brand(BrandBase):
     """
     Brand guidelines in a class.
@@ -59,9 +94,11 @@ class Brand(BrandBase):
         from serialization and representation.
     """
 
+    # Validators run on creation and on assignment. Existing instances aren't
+    # copied when validated again, e.g. by `Brand.model_validate(brand)`, which
+    # returns the same `Brand`. Its model validators still run in that case.
     model_config = ConfigDict(
         extra="forbid",
-        revalidate_instances="always",
         validate_assignment=True,
     )
 
@@ -123,14 +160,24 @@ class Brand(BrandBase):
         brand = Brand.from_yaml("path/to/_brand.yml")
         ```
         """
-        path = Path(path).absolute()
+        path = path if isinstance(path, Path) else Path(path)
+        if not path.is_absolute():
+            path = path.absolute()
+
+        try:
+            path_stat = path.stat()
+        except FileNotFoundError:
+            path_stat = None
 
-        if path.is_dir() or path.suffix == ".py":
+        is_dir = path_stat is not None and S_ISDIR(path_stat.st_mode)
+        if is_dir or path.suffix == ".py":
             # allows users to simply pass `__file__`
             path = find_project_brand_yml(path)
+            path_stat = None
 
-        with open(path, "r") as f:
-            brand_data = yaml.load(f)
+        # Re-uses the stat() result from above, unless we had to find the file
+        file_entry = yaml_load_file_entry(path, path_stat)
+        brand_data = deepcopy(file_entry.data)
 
         if not isinstance(brand_data, dict):
             raise ValueError(
@@ -139,7 +186,16 @@ class Brand(BrandBase):
 
         brand_data["path"] = path
 
-        return cls.model_validate(brand_data)
+        # An unchanged file that was validated before can't contain circular
+        # references, so we don't need to check for them again. The flag is
+        # kept with the cached file data, so it's bound by the same cache.
+        if not file_entry.validated:
+            brand = cls.model_validate(brand_data)
+            file_entry.validated = True
+            return brand
+
+        with skip_circular_reference_check():
+            return cls.model_validate(brand_data)
 
     @classmethod
     def from_yaml_str(cls, text: str, path: str | Path | None = None):
@@ -190,13 +246,72 @@ class Brand(BrandBase):
         brand.color.primary
         ```
         """
-        data = yaml.load(text)
+        data = yaml_load_data(text)
 
         if path is not None:
             data["path"] = Path(path).absolute()
 
         return cls.model_validate(data)
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict[str, Any]):
+        """
+        Create a Brand instance from trusted, previously validated data.
+
+        Re-creates a [`brand_yml.Brand`](`brand_yml.Brand`) from data that was
+        already produced by a validated brand, e.g. from `brand.model_dump()`,
+        without paying the full cost of validation. Nested brand models are
+        constructed directly and colors in `typography` are not resolved
+        again, so this method should not be used for user-provided data.
+        References between colors in `color` are still resolved. Use
+        [`brand_yml.Brand.from_yaml`](`brand_yml.Brand.from_yaml`) or
+        [`brand_yml.Brand.from_yaml_str`](`brand_yml.Brand.from_yaml_str`)
+        for user input.
+
+        Only the output of `brand.model_dump()` is supported, e.g. of a brand
+        loaded with `Brand.from_yaml()`. Because values are neither validated
+        nor coerced, other data, such as `brand.model_dump(mode="json")` or
+        the contents of a `_brand.yml` file, doesn't round-trip to an equal
+        `Brand`: URLs stay plain strings, for example, and shorthand values
+        aren't expanded.
+
+        Parameters
+        ----------
+        data
+            A dictionary of brand data, as returned by `brand.model_dump()`.
+            Because `path` is excluded from serialization, you may add it to
+            `data` to restore the location of local files.
+
+        Returns
+        -------
+        :
+            A `brand_yml.Brand` object.
+
+        Examples
+        --------
+
+        ```{python}
+        from brand_yml import Brand
+
+        brand = Brand.from_yaml_str(\"\"\"
+        color:
+          palette:
+            orange: "#ff9a02"
+          primary: orange
+        \"\"\")
+
+        brand_copy = Brand.from_trusted_dict(brand.model_dump())
+        brand_copy.color.primary
+        ```
+        """
+        color = data.get("color")
+        if isinstance(color, dict):
+            data = {**data, "color": BrandColor._construct_resolved(color)}
+
+        brand = model_construct_recursive(cls, data)
+        brand._set_root_path()  # type: ignore[reportCallIssue]
+        return brand
+
     def model_dump_yaml(
         self,
         stream: Any = None,
@@ -271,42 +386,46 @@ class Brand(BrandBase):
         if self.typography is None:
             return self
 
-        color_defs = self.color.to_dict() if self.color else {}
-        color_names = [
-            k for k in BrandColor.model_fields.keys() if k != "palette"
-        ]
+        # Gather all string values in typography color fields, then resolve
+        # them together in one tight loop
+        top_fields: list[str] = []
+        nodes: list[BaseModel] = []
+        node_fields: list[str] = []
+        values: list[str] = []
 
-        for top_field in self.typography.model_fields.keys():
+        for top_field, color_fields in _typography_color_fields:
             typography_node = getattr(self.typography, top_field)
 
-            if not isinstance(typography_node, BaseModel):
+            if typography_node is None:
                 continue
 
-            for typography_node_field in typography_node.model_fields.keys():
-                if typography_node_field not in ("color", "background_color"):
-                    continue
-
+            for typography_node_field in color_fields:
                 value = getattr(typography_node, typography_node_field)
-                if value is None or not isinstance(value, str):
-                    continue
-
-                is_defined = value in color_defs
-                is_theme_color = value in color_names
-
-                if not is_defined:
-                    if is_theme_color:
-                        raise ValueError(
-                            f"`typography.{top_field}.{typography_node_field}` "
-                            f"referred to `color.{value}` which is not defined."
-                        )
-                    else:
-                        continue
-
-                setattr(
-                    typography_node,
-                    typography_node_field,
-                    color_defs[value],
-                )
+                if isinstance(value, str):
+                    top_fields.append(top_field)
+                    nodes.append(typography_node)
+                    node_fields.append(typography_node_field)
+                    values.append(value)
+
+        if len(values) == 0:
+            return self
+
+        color_defs = self.color.to_dict() if self.color else {}
+
+        colors = [color_defs.get(value) for value in values]
+
+        for top_field, node, node_field, value, color in zip(
+            top_fields, nodes, node_fields, values, colors
+        ):
+            if color is None:
+                if value in theme_color_fields:
+                    raise ValueError(
+                        f"`typography.{top_field}.{node_field}` "
+                        f"referred to `color.{value}` which is not defined."
+                    )
+                continue
+
+            setattr(node, node_field, color)
 
         return self
 
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
 from copy import deepcopy
 from textwrap import indent
 from typing import Any, Generic, Iterable, TypeVar, Union
@@ -79,9 +82,12 @@ def defs_get(
     # references, so we don't need to check for them here.
 
     with_value = deepcopy(defs[key])
-    logger.debug(
-        level_indent(f"key {key} is in defs with value {with_value!r}", level)
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            level_indent(
+                f"key {key} is in defs with value {with_value!r}", level
+            )
+        )
 
     if is_dict_or_basemodel(with_value):
         defs_replace_recursively(with_value, defs=defs, level=level)
@@ -132,28 +138,35 @@ def defs_replace_recursively(
         logger.error("Hit recursion limit recursing into `items`")
         return
 
+    skip_keys = {exclude or "with_", "with_"}
+    # Avoid formatting debug messages for every key unless they'll be logged
+    debug = logger.isEnabledFor(logging.DEBUG)
+
     for key in item_keys(items):
         value = get_value(items, key)
 
-        if value is defs or key in set((exclude or "with_", "with_")):
+        if value is defs or key in skip_keys:
             # We replace internal def references when resolving sibling fields
             continue
 
-        logger.debug(level_indent(f"inspecting key {key}", level))
+        if debug:
+            logger.debug(level_indent(f"inspecting key {key}", level))
         if isinstance(value, str) and value in defs:
             new_value = defs_get(defs, value, level=level + 1)
-            logger.debug(
-                level_indent(
-                    f"replacing key {key} with definition from {value}: {new_value!r}",
-                    level,
+            if debug:
+                logger.debug(
+                    level_indent(
+                        f"replacing key {key} with definition from {value}: {new_value!r}",
+                        level,
+                    )
                 )
-            )
             if isinstance(items, BaseModel):
                 setattr(items, key, new_value)
             elif isinstance(items, dict):
                 items[key] = new_value
         elif is_dict_or_basemodel(value):
-            logger.debug(level_indent(f"recursing into {key}", level))
+            if debug:
+                logger.debug(level_indent(f"recursing into {key}", level))
             defs_replace_recursively(
                 value,
                 defs=defs,
@@ -161,7 +174,7 @@ def defs_replace_recursively(
                 exclude=exclude,
                 name=name,
             )
-        else:
+        elif debug:
             logger.debug(
                 level_indent(
                     f"skipping {key}, not replaceable (or not a dict or pydantic model)",
@@ -170,6 +183,56 @@ def defs_replace_recursively(
             )
 
 
+def defs_resolve_flat(
+    defs: dict[str, str],
+    name: str | None = None,
+) -> dict[str, str]:
+    """
+    Resolve references between the string definitions in `defs`.
+
+    A value in `defs` refers to another definition when it exactly matches a
+    key in `defs`. Each chain of references is followed once, so every value is
+    resolved in dependency order, e.g. `{"a": "b", "b": "c", "c": "#fff"}`
+    resolves to `"#fff"` for all three keys.
+
+    Parameters
+    ----------
+    defs
+        A flat dictionary of string definitions.
+
+    name
+        A name for `defs`, used in error messages.
+
+    Returns
+    -------
+    :
+        A new dictionary with the same keys, in the same order, as `defs`
+        where every value is fully resolved.
+    """
+    check_circular_references(defs, name=name)
+
+    resolved: dict[str, str] = {}
+    for key in defs:
+        # Follow the chain of references until we reach a value that is not
+        # another definition (or one we've already resolved)
+        chain: list[str] = []
+        in_chain: set[str] = set()
+        value = key
+        while value in defs and value not in resolved:
+            if value in in_chain:
+                # Only reachable if the check above was skipped
+                raise CircularReferenceError([*chain, value], chain, name)
+            chain.append(value)
+            in_chain.add(value)
+            value = defs[value]
+
+        value = resolved.get(value, value)
+        for ref in chain:
+            resolved[ref] = value
+
+    return {key: resolved[key] for key in defs}
+
+
 def level_indent(x: str, level: int) -> str:
     return indent(x, ("." * level))
 
@@ -190,52 +253,123 @@ def get_value(items: dict | BaseModel, key: str) -> object:
         return items[key]
 
 
+_skip_circular_reference_check: ContextVar[bool] = ContextVar(
+    "brand_yml_skip_circular_reference_check", default=False
+)
+
+
+@contextmanager
+def skip_circular_reference_check():
+    """
+    Skip `check_circular_references()` within this context.
+
+    Only use this for data that is known to be free of circular references,
+    e.g. data that has been validated before. `defs_resolve_flat()` still
+    reports circular references it runs into, but nested definitions resolved
+    by `defs_replace_recursively()` are not checked.
+    """
+    token = _skip_circular_reference_check.set(True)
+    try:
+        yield
+    finally:
+        _skip_circular_reference_check.reset(token)
+
+
 def check_circular_references(
     data: dict[str, Any],
-    current: object | None = None,
-    seen: list[str] | None = None,
-    path: list[str] | None = None,
     name: str | None = None,
 ):
-    current = current if current is not None else data
-    seen = seen if seen is not None else []
-    path = path if path is not None else []
-
-    if not is_dict_or_basemodel(current):  # pragma: no cover
-        if not isinstance(current, str):
-            raise ValueError(
-                "All values must be strings, dictionaries, or pydantic models."
-            )
+    """
+    Check that definitions in `data` don't refer to each other in a cycle.
+
+    A definition refers to another definition when it, or any string nested
+    within it, exactly matches a key in `data`. References are followed
+    iteratively, and definitions that have been fully explored without finding
+    a cycle are not explored again.
+
+    Raises
+    ------
+    CircularReferenceError
+        If a definition refers back to itself, e.g. `a -> b -> a`.
+    """
+    if _skip_circular_reference_check.get():
         return
 
-    logger.debug(f"current is: {current}")
-    logger.debug(f"seen is: {seen}")
-    logger.debug(f"path is: {path}")
+    references: dict[str, list[tuple[str, tuple[str, ...]]]] = {}
+    checked: set[str] = set()
+    debug = logger.isEnabledFor(logging.DEBUG)
 
-    for key in item_keys(current):
-        value = get_value(current, key)
+    def refs(key: str) -> list[tuple[str, tuple[str, ...]]]:
+        if key not in references:
+            references[key] = find_references(data, data[key])
+        return references[key]
 
-        # Pass through objects we can recurse or strings if they're keys in `data`
-        if isinstance(value, str):
-            if value not in data:
-                continue
-        elif not is_dict_or_basemodel(value):
+    for start in data.keys():
+        if start in checked:
             continue
 
-        path_key = [*path, key]
-
-        # implied value is also in data by above check
-        if isinstance(value, str):
-            seen_key = [*seen, *([key, value] if len(seen) == 0 else [value])]
-            if value in seen:
-                raise CircularReferenceError(seen_key, path_key, name)
-            else:
-                new_current = {k: v for k, v in data.items() if k == value}
-                check_circular_references(
-                    data, new_current, seen_key, path_key, name
-                )
-        else:
-            check_circular_references(data, value, seen, path_key, name)
+        if debug:
+            logger.debug(f"checking {start} for circular references")
+
+        # `chain[i]` refers to `chain[i + 1]` via the nested keys in `via[i]`
+        chain: list[str] = [start]
+        via: list[tuple[str, ...]] = []
+        stack = [iter(refs(start))]
+
+        while stack:
+            ref = next(stack[-1], None)
+
+            if ref is None:
+                stack.pop()
+                checked.add(chain.pop())
+                if via:
+                    via.pop()
+                continue
+
+            value, path = ref
+
+            if value in chain:
+                seen = [*chain, value]
+                path_key = [
+                    k
+                    for key, keys in zip(chain, [*via, path])
+                    for k in (key, *keys)
+                ]
+                raise CircularReferenceError(seen, path_key, name)
+
+            if value in checked:
+                continue
+
+            chain.append(value)
+            via.append(path)
+            stack.append(iter(refs(value)))
+
+
+def find_references(
+    data: dict[str, Any],
+    value: Any,
+) -> list[tuple[str, tuple[str, ...]]]:
+    """
+    Find strings in `value` that refer to keys in `data`.
+
+    Returns a list of `(key, path)` tuples in depth-first order, where `path`
+    holds the nested keys leading to the reference within `value`.
+    """
+    found: list[tuple[str, tuple[str, ...]]] = []
+    stack: list[tuple[Any, tuple[str, ...]]] = [(value, ())]
+
+    while stack:
+        item, path = stack.pop()
+
+        if isinstance(item, str):
+            if item in data:
+                found.append((item, path))
+        elif is_dict_or_basemodel(item):
+            # Push children in reverse so they are visited in order
+            for key in reversed(list(item_keys(item))):
+                stack.append((get_value(item, key), (*path, key)))
+
+    return found
 
 
 class CircularReferenceError(Exception):
@@ -2,11 +2,31 @@ from __future__ import annotations
 
 import os
 import re
+import sys
 from contextlib import contextmanager
+from functools import lru_cache
+from inspect import isclass
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Union
-
-from pydantic import BaseModel
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    ForwardRef,
+    List,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, RootModel, TypeAdapter
+
+if sys.version_info >= (3, 10):
+    from types import UnionType
+
+    union_types = (Union, UnionType)
+else:
+    union_types = (Union,)
 
 rgx_css_value_unit = re.compile(r"^(-?\d*\.?\d+)([a-zA-Z%]*)$")
 
@@ -141,6 +161,117 @@ def recurse_dicts_and_models(
             apply(value)
 
 
+class ModelCache(Dict[str, Any]):
+    """
+    A dictionary for values derived from and cached on a Pydantic model.
+
+    Pydantic includes private attributes when comparing models, so caches are
+    always considered equal to each other. Otherwise, two models with the same
+    field values would compare differently depending on which cached values
+    had been computed.
+    """
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ModelCache)
+
+    def __ne__(self, other: object) -> bool:
+        return not self.__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+
+def model_construct_recursive(
+    model: type[ModelType],
+    data: Dict[str, Any],
+) -> ModelType:
+    """
+    Construct a model and its nested models from trusted data without
+    validation.
+
+    Fields whose type is a single Pydantic model (optionally `None`) are built
+    recursively with `model_construct()`, skipping validation entirely. Other
+    container values, e.g. lists or unions of models, are validated against the
+    field's type so that they are still converted into model instances. Scalar
+    values are used as-is.
+
+    Only use this function with data that has already been validated, e.g. data
+    produced by `model_dump()` on a validated model.
+
+    Parameters
+    ----------
+    model
+        The Pydantic model class to construct.
+
+    data
+        A dictionary of field values, keyed by field name or alias.
+
+    Returns
+    -------
+    :
+        An instance of `model`.
+    """
+    fields = _model_fields_by_key(model)
+
+    values: Dict[str, Any] = {}
+    for key, value in data.items():
+        if key not in fields:
+            # Passed through, `model_construct()` handles allowed extras
+            values[key] = value
+            continue
+
+        name, annotation = fields[key]
+        values[name] = _construct_value(annotation, value)
+
+    return model.model_construct(**values)
+
+
+@lru_cache(maxsize=None)
+def _model_fields_by_key(model: type[BaseModel]) -> Dict[str, tuple[str, Any]]:
+    """Map field names and aliases of `model` to the field's name and type."""
+    if any(
+        isinstance(f.annotation, ForwardRef)
+        for f in model.model_fields.values()
+    ):
+        # Models that refer to classes defined later in their module may keep
+        # unresolved annotations on their fields
+        model.model_rebuild(force=True)
+
+    fields: Dict[str, tuple[str, Any]] = {}
+    for name, field in model.model_fields.items():
+        fields[name] = (name, field.annotation)
+        if field.alias is not None:
+            fields[field.alias] = (name, field.annotation)
+
+    return fields
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    if not isinstance(value, (dict, list)):
+        return value
+
+    args = get_args(annotation) if get_origin(annotation) in union_types else ()
+    candidates = [a for a in args if a is not type(None)] or [annotation]
+    if len(candidates) == 1:
+        cls = candidates[0]
+        if (
+            isinstance(value, dict)
+            and isclass(cls)
+            and issubclass(cls, BaseModel)
+            and not issubclass(cls, RootModel)
+        ):
+            return model_construct_recursive(cls, value)
+
+    return _type_adapter(annotation).validate_python(value)
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+
 @contextmanager
 def set_env_var(key: str, value: str):
     original_value = os.environ.get(key)
@@ -1,19 +1,104 @@
 from __future__ import annotations
 
 import json
+import os
+from functools import lru_cache
+from io import StringIO
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
 
 from pydantic import BaseModel, RootModel
-from ruamel.yaml import YAML
-from ruamel.yaml.compat import StringIO
 
+if TYPE_CHECKING:
+    from ruamel.yaml import YAML
 
-class BrandYaml(YAML):
+# YAML libraries are imported on first use to keep `import brand_yml` fast.
+
+
+@lru_cache(maxsize=None)
+def _yaml_data_loader() -> Callable[[Any], Any]:
+    from ruamel.yaml import YAML  # noqa: PLC0415
+
+    # We only need plain data when reading `_brand.yml`, so we don't need
+    # ruamel's round-trip loader. The safe loader uses ruamel's C-based parser
+    # when `ruamel.yaml.clib` is available and, like the round-trip loader,
+    # follows YAML 1.2 (e.g. `Yes` and `on` are strings, `012` is `12`).
+    return YAML(typ="safe", pure=False).load
+
+
+def yaml_load_data(stream: Any) -> Any:
+    """
+    Load plain data from YAML.
+
+    Uses ruamel.yaml's safe loader, which follows the YAML 1.2 spec.
+    """
+    return _yaml_data_loader()(stream)
+
+
+class YamlFileEntry:
+    """
+    Parsed data of a YAML file, as stored in the file cache.
+
+    `validated` lets callers record that `data` passed their validation, so
+    the flag is dropped together with the cached data when the file changes
+    or the entry is evicted.
+    """
+
+    __slots__ = ("data", "validated")
+
+    def __init__(self, data: Any):
+        self.data = data
+        self.validated = False
+
+
+@lru_cache(maxsize=64)
+def _yaml_load_file_cached(
+    path: str, mtime_ns: int, size: int
+) -> YamlFileEntry:
+    # `mtime_ns` and `size` are only used as part of the cache key
+    with open(path, "rb") as f:
+        return YamlFileEntry(yaml_load_data(f.read()))
+
+
+def yaml_load_file_entry(
+    path: Path, st: os.stat_result | None = None
+) -> YamlFileEntry:
+    """
+    Get the cache entry for a YAML file, parsing the file if needed.
+
+    Parsed data is cached by file path, modification time and size, so that
+    repeatedly reading an unchanged file skips parsing. The entry's `data` is
+    shared, so callers need to copy it before modifying it. Pass `st` to re-use
+    the result of a previous `stat()` call on `path`.
     """
-    A custom yaml class that allows dumping to a string instead of a file.
+    if st is None:
+        st = path.stat()
+    return _yaml_load_file_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+class BrandYaml:
+    """
+    A round-trip `ruamel.yaml` wrapper that allows dumping to a string instead
+    of a file. `ruamel.yaml` is only imported when first used.
     """
 
     # https://yaml.readthedocs.io/en/latest/example/#output-of-dump-as-a-string
 
+    def __init__(self):
+        self._yaml: YAML | None = None
+
+    @property
+    def yaml(self) -> YAML:
+        if self._yaml is None:
+            from ruamel.yaml import YAML  # noqa: PLC0415
+
+            self._yaml = YAML()
+            self._yaml.indent(mapping=2, sequence=4, offset=2)
+        return self._yaml
+
+    def load(self, stream: Any) -> Any:
+        return self.yaml.load(stream)
+
     def dump(self, data, stream=None, **kw):
         if isinstance(data, (BaseModel, RootModel)):
             # Dump to JSON first to have Pydantic handle casting to JSON formats,
@@ -30,11 +115,10 @@ class BrandYaml(YAML):
         if to_string:
             stream = StringIO()
 
-        YAML.dump(self, data, stream, **kw)
+        self.yaml.dump(data, stream, **kw)
 
         if to_string:
             return stream.getvalue()
 
 
 yaml_brand = BrandYaml()
-yaml_brand.indent(mapping=2, sequence=4, offset=2)
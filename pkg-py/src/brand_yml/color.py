@@ -8,8 +8,8 @@ palette and mappings to common theme colors.
 from __future__ import annotations
 
 import re
-from copy import deepcopy
-from typing import Literal, Optional
+from sys import intern
+from typing import Any, Literal, Optional
 
 from pydantic import (
     ConfigDict,
@@ -17,13 +17,40 @@ from pydantic import (
     model_validator,
 )
 
-from ._defs import check_circular_references, defs_replace_recursively
+from ._defs import defs_resolve_flat
+from ._utils import ModelCache
 from ._utils_docs import add_example_yaml
 from .base import BrandBase
 
 rgx_valid_sass_name = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_-]*$")
 
 
+def intern_hex_color(value: str) -> str:
+    """
+    Intern hex color strings.
+
+    The same hex colors are often repeated across a brand's palette and theme
+    colors, and across brands, so we keep a single copy of each.
+    """
+    return intern(value) if value.startswith("#") else value
+
+
+# The theme color fields of `BrandColor`, i.e. all fields except `palette`
+theme_color_fields: tuple[str, ...] = (
+    "foreground",
+    "background",
+    "primary",
+    "secondary",
+    "tertiary",
+    "success",
+    "info",
+    "warning",
+    "danger",
+    "light",
+    "dark",
+)
+
+
 @add_example_yaml(
     {
         "path": "brand-color-direct-posit.yml",
@@ -187,11 +214,12 @@ class BrandColor(BrandBase):
         or high-contrast background color on light elements.
     """
 
+    # Colors are resolved on creation and re-resolved on assignment. Existing
+    # instances passed to a `Brand` aren't copied, so the `Brand` shares the
+    # instance, and `resolve_palette_values()` skips colors it already resolved.
     model_config = ConfigDict(
         extra="forbid",
-        revalidate_instances="always",
         validate_assignment=True,
-        use_attribute_docstrings=True,
     )
 
     palette: dict[str, str] | None = None
@@ -208,6 +236,8 @@ class BrandColor(BrandBase):
     light: Optional[str] = None
     dark: Optional[str] = None
 
+    _to_dict_cache: ModelCache = ModelCache()
+
     @field_validator("palette")
     @classmethod
     def _enforce_palette_sass_var_names(cls, value: dict[str, str] | None):
@@ -237,13 +267,31 @@ class BrandColor(BrandBase):
         if not isinstance(value, dict):
             raise ValueError("`palette` must be a dictionary")
 
-        check_circular_references(value)
-        # We resolve `color.palette` on load or on replacement only
+        # We resolve `color.palette` on load or on replacement only. This also
+        # checks `palette` for circular references.
         # TODO: Replace with class with getter/setters
         #       Retain original values, return resolved values, and re-validate on update.
-        defs_replace_recursively(value, value, name="palette")
+        resolved = defs_resolve_flat(value, name="palette")
+        return {k: intern_hex_color(v) for k, v in resolved.items()}
 
-        return value
+    @classmethod
+    def _construct_resolved(cls, data: dict[str, Any]) -> BrandColor:
+        """
+        Create a `BrandColor` from trusted data without validating it.
+
+        Field values are used as-is, but references between colors are still
+        resolved, once, as they would be during validation.
+        """
+        palette = data.get("palette")
+        if palette is not None:
+            data = {
+                **data,
+                "palette": defs_resolve_flat(palette, name="palette"),
+            }
+
+        color = cls.model_construct(**data)
+        color.resolve_palette_values()  # type: ignore[reportCallIssue]
+        return color
 
     def to_dict(
         self,
@@ -270,23 +318,86 @@ class BrandColor(BrandBase):
               `color.palette`.
             * `"palette"` returns a dictionary of only the palette colors
         """
+        cache = self._color_cache()
+        if include not in cache:
+            cache[include] = self._to_dict(include)
+
+        return dict(cache[include])
+
+    def _color_cache(self) -> ModelCache:
+        """
+        Cached color definitions for the current colors.
+
+        The cache is keyed on the current palette and theme color values, so
+        that it's replaced whenever they change, whether by validation, by
+        `model_copy(update=...)` or by modifying `palette` in place.
+        """
+        fields = vars(self)
+        theme = tuple(fields[field] for field in theme_color_fields)
+        palette = fields["palette"]
+
+        cache = self._to_dict_cache
+        if "key" in cache and cache["key"] == (theme, palette):
+            return cache
+
+        # Copy the palette so that in-place changes don't also change the key
+        key = (theme, None if palette is None else palette.copy())
+        cache = ModelCache(key=key)
+        self._to_dict_cache = cache
+        return cache
+
+    def _to_dict(
+        self,
+        include: Literal["all", "theme", "palette"] = "all",
+    ) -> dict[str, str]:
         defs: dict[str, str] = {}
-        defs_theme: dict[str, str] = {}
 
-        if include in ("all", "palette"):
-            defs = deepcopy(self.palette) if self.palette is not None else {}
+        if include in ("all", "palette") and self.palette is not None:
+            # Palette values are strings, a shallow copy is enough
+            defs = self.palette.copy()
         if include in ("all", "theme"):
-            defs_theme = self.model_dump(exclude={"palette"}, exclude_none=True)
+            # Theme colors are plain strings, so we can skip `model_dump()` and
+            # read them straight from the model's field storage
+            fields = vars(self)
+            for field in theme_color_fields:
+                value = fields[field]
+                if value is not None:
+                    defs[field] = value
 
-        defs.update(defs_theme)
         return defs
 
+    def _resolved_defs(self) -> dict[str, str]:
+        """
+        Color definitions with all references to other colors resolved.
+
+        The result is cached with the `to_dict()` values and should not be
+        modified by the caller.
+        """
+        cache = self._color_cache()
+        if "resolved" not in cache:
+            cache["resolved"] = defs_resolve_flat(self.to_dict(), name="color")
+
+        return cache["resolved"]
+
     @model_validator(mode="after")
     def resolve_palette_values(self):
-        defs_replace_recursively(
-            self,
-            defs=self.to_dict(),
-            name="color",
-            exclude="palette",
-        )
+        if "final" in self._color_cache():
+            # Pydantic runs this validator again for existing instances, e.g.
+            # when they're passed to `Brand`, but the colors haven't changed
+            return self
+
+        resolved = self._resolved_defs()
+        # Resolved values are final, so we write them directly instead of
+        # re-validating the model for each replaced theme color
+        fields = vars(self)
+        for field in theme_color_fields:
+            value = fields[field]
+            if value is not None:
+                value = resolved[value] if value in resolved else value
+                fields[field] = intern_hex_color(value)
+        # Replacing theme colors with their resolved values doesn't change the
+        # resolved definitions, so they're kept for the next caller
+        cache = self._color_cache()
+        cache["resolved"] = resolved
+        cache["final"] = True
         return self
@@ -12,10 +12,10 @@ choices in brand guidelines.
 
 from __future__ import annotations
 
-import itertools
 import os
 import shutil
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
 from re import split as re_split
 from textwrap import indent
@@ -23,12 +23,13 @@ from typing import (
     TYPE_CHECKING,
     Annotated,
     Any,
+    Callable,
     Literal,
     TypeVar,
     Union,
     overload,
 )
-from urllib.parse import urlencode, urljoin
+from urllib.parse import quote_plus, urlencode, urljoin
 
 from htmltools import HTMLDependency
 from pydantic import (
@@ -131,6 +132,16 @@ font_weight_map: dict[str, BrandTypographyFontWeightRoundIntType] = {
     "black": 900,
 }
 
+# Named weights as returned by `validate_font_weight()`: "normal" and "bold" are
+# kept as-is, other names are converted to their numeric weight.
+font_weight_named_lookup: dict[
+    str, BrandTypographyFontWeightRoundIntType | Literal["normal", "bold"]
+] = {
+    **font_weight_map,
+    "normal": "normal",
+    "bold": "bold",
+}
+
 # https://developer.mozilla.org/en-US/docs/Web/CSS/@font-face/src#font_formats
 font_formats = {
     ".otc": "collection",
@@ -170,6 +181,9 @@ class BrandUnsupportedFontFileFormat(ValueError):
         )
 
 
+font_formats_supported = frozenset(BrandUnsupportedFontFileFormat.supported)
+
+
 # Font Weights -----------------------------------------------------------------
 @overload
 def validate_font_weight(
@@ -195,16 +209,21 @@ def validate_font_weight(
     if value is None:
         return "auto"
 
+    if type(value) is int:
+        # Fast path for the most common case, e.g. `weight: 400`
+        if 100 <= value <= 900 and value % 100 == 0:
+            return value
+        raise BrandInvalidFontWeight(value, allow_auto=allow_auto)
+
     if not isinstance(value, (str, int, float, bool)):
         raise BrandInvalidFontWeight(value, allow_auto=allow_auto)
 
     if isinstance(value, str):
         if allow_auto and value == "auto":
             return value
-        if value in ("normal", "bold"):
-            return value
-        if value in font_weight_map:
-            return font_weight_map[value]
+        weight = font_weight_named_lookup.get(value)
+        if weight is not None:
+            return weight
 
     try:
         value = int(value)
@@ -420,10 +439,7 @@ class BrandTypographyFontFilesPath(BaseModel):
     def validate_path(
         cls, value: FileLocationLocalOrUrlType
     ) -> FileLocationLocalOrUrlType:
-        ext = Path(str(value.root)).suffix
-        if not ext:  # cover: for type checker
-            raise BrandUnsupportedFontFileFormat(value.root)
-
+        ext = os.path.splitext(str(value.root))[1]
         if ext not in font_formats:
             raise BrandUnsupportedFontFileFormat(value.root)
 
@@ -432,13 +448,9 @@ class BrandTypographyFontFilesPath(BaseModel):
     @property
     def format(self) -> Literal["opentype", "truetype", "woff", "woff2"]:
         path = str(self.path.root)
-        path_ext = Path(path).suffix
-
-        if path_ext not in font_formats:
-            raise BrandUnsupportedFontFileFormat(path)
+        fmt = font_formats.get(os.path.splitext(path)[1])
 
-        fmt = font_formats[path_ext]
-        if fmt not in BrandUnsupportedFontFileFormat.supported:
+        if fmt not in font_formats_supported:
             raise BrandUnsupportedFontFileFormat(path)
 
         return fmt
@@ -567,6 +579,81 @@ def google_font_weight_discriminator(value: Any) -> str:
         return "weights"
 
 
+@lru_cache(maxsize=256)
+def google_fonts_import_url(
+    url: str,
+    version: int,
+    family: str,
+    weight: tuple[str, ...],
+    ital: tuple[int, ...],
+    display: str,
+) -> str:
+    """
+    Build the `@import` URL for a font family from a Google Fonts-compatible API.
+
+    The URL only depends on its arguments, so results are cached.
+    """
+    return _make_url_builder(url, version, display)(family, weight, ital)
+
+
+@lru_cache(maxsize=None)
+def _make_url_builder(
+    url: str,
+    version: int,
+    display: str,
+) -> Callable[[str, tuple[str, ...], tuple[int, ...]], str]:
+    # The API endpoint and `display` parameter are shared by every font from
+    # the same source, so only the `family` parameter is encoded per font.
+    if version == 1:
+        base = urljoin(url, "css") + "?"
+        family_values = _family_values_v1
+    else:
+        base = urljoin(url, "css2") + "?"
+        family_values = _family_values_v2
+
+    display_param = urlencode({"display": display})
+
+    def build(
+        family: str,
+        weight: tuple[str, ...],
+        ital: tuple[int, ...],
+    ) -> str:
+        family_param = quote_plus(family + family_values(weight, ital))
+        return f"{base}family={family_param}&{display_param}"
+
+    return build
+
+
+def _family_values_v1(weight: tuple[str, ...], ital: tuple[int, ...]) -> str:
+    style_map = ("", "i")
+
+    values = ""
+    if len(weight) > 0 and len(ital) > 0:
+        values = ",".join([f"{w}{style_map[i]}" for w in weight for i in ital])
+    elif len(weight) > 0:
+        values = ",".join(weight)
+    elif len(ital) > 0:
+        values = ",".join(["italic" if i else "regular" for i in ital])
+
+    return "" if len(values) == 0 else f":{values}"
+
+
+def _family_values_v2(weight: tuple[str, ...], ital: tuple[int, ...]) -> str:
+    values = ""
+    axis = ""
+    if len(weight) > 0 and len(ital) > 0:
+        values = ";".join([f"{i},{w}" for i in ital for w in weight])
+        axis = "ital,wght"
+    elif len(weight) > 0:
+        values = ";".join(weight)
+        axis = "wght"
+    elif len(ital) > 0:
+        values = ";".join([str(i) for i in ital])
+        axis = "ital"
+
+    return "" if len(values) == 0 else f":{axis}@{values}"
+
+
 class BrandTypographyGoogleFontsApi(BrandTypographyFontSource):
     """
     A font source that utilizes the Google Fonts (or a compatible) API.
@@ -644,65 +731,29 @@ class BrandTypographyGoogleFontsApi(BrandTypographyFontSource):
 
     def to_import_url(self) -> str:
         """Returns the URL for the font family to be used in a CSS `@import` statement."""
-        if self.version == 1:
-            return self._import_url_v1()
-        return self._import_url_v2()
-
-    def _import_url_v1(self) -> str:
-        weight = self.weight.to_url_list()
-        style_str = sorted(
-            self.style if isinstance(self.style, list) else [self.style]
-        )
-        style_map = {"normal": "", "italic": "i"}
-        ital: list[str] = sorted([style_map[s] for s in style_str])
-
-        values = []
-        if len(weight) > 0 and len(ital) > 0:
-            values = [f"{w}{i}" for w, i in itertools.product(weight, ital)]
-        elif len(weight) > 0:
-            values = [str(w) for w in weight]
-        elif len(ital) > 0:
-            values = ["regular" if i == "" else "italic" for i in ital]
-
-        family_values = "" if len(values) == 0 else f":{','.join(values)}"
-        params = urlencode(
-            {
-                "family": self.family + family_values,
-                "display": self.display,
-            }
+        weight, ital = self._normalize_weight_style()
+        return google_fonts_import_url(
+            url=str(self.url),
+            version=self.version,
+            family=self.family,
+            weight=weight,
+            ital=ital,
+            display=self.display,
         )
 
-        return urljoin(str(self.url), f"css?{params}")
-
-    def _import_url_v2(self) -> str:
-        weight = self.weight.to_url_list()
-        style_str = sorted(
-            self.style if isinstance(self.style, list) else [self.style]
-        )
-        style_map = {"normal": 0, "italic": 1}
-        ital: list[int] = sorted([style_map[s] for s in style_str])
-
-        values = []
-        axis = ""
-        if len(weight) > 0 and len(ital) > 0:
-            values = [f"{i},{w}" for i, w in itertools.product(ital, weight)]
-            axis = "ital,wght"
-        elif len(weight) > 0:
-            values = [str(w) for w in weight]
-            axis = "wght"
-        elif len(ital) > 0:
-            values = [str(i) for i in ital]
-            axis = "ital"
-
-        axis_range = "" if len(values) == 0 else f":{axis}@{';'.join(values)}"
-        params = urlencode(
-            {
-                "family": self.family + axis_range,
-                "display": self.display,
-            }
-        )
+    def _normalize_weight_style(
+        self,
+    ) -> tuple[tuple[str, ...], tuple[int, ...]]:
+        """
+        Sorted font weights and styles for the API URL.
 
-        return urljoin(str(self.url), f"css2?{params}")
+        Weights are returned as strings and styles as `0` (normal) or `1`
+        (italic), so that both API versions share the sorting work.
+        """
+        weight = tuple(self.weight.to_url_list())  # already sorted
+        styles = self.style if isinstance(self.style, list) else [self.style]
+        ital = tuple(sorted(int(s == "italic") for s in styles))
+        return weight, ital
 
 
 class BrandTypographyFontGoogle(BrandTypographyGoogleFontsApi):
@@ -2,10 +2,13 @@ import tempfile
 from pathlib import Path
 
 import pytest
-from brand_yml import Brand
+from brand_yml import Brand, BrandColor
+from brand_yml._defs import CircularReferenceError
 from brand_yml.file import FileLocationLocal
 from brand_yml.logo import BrandLogo, BrandLogoResource
 from brand_yml.typography import BrandTypography, BrandTypographyFontFiles
+from pydantic import HttpUrl
+from utils import path_examples
 
 path_fixtures = Path(__file__).parent / "fixtures"
 
@@ -111,3 +114,108 @@ def test_brand_yml_paths():
     # brand.path must be absolute
     with pytest.raises(ValueError):
         brand.path = Path("_brand.yml")
+
+
+def test_brand_yml_from_yaml_checks_changed_file(tmp_path: Path):
+    path = tmp_path / "_brand.yml"
+    path.write_text(
+        "color:\n  palette:\n    blue: '#0000ff'\n  primary: blue\n"
+    )
+
+    brand = Brand.from_yaml(path)
+    assert brand.color is not None
+    assert brand.color.primary == "#0000ff"
+
+    # Loading the unchanged file again gives the same brand
+    assert Brand.from_yaml(path) == brand
+
+    # Circular references added by editing the file are still caught
+    path.write_text(
+        "color:\n  palette:\n    blue: navy\n    navy: blue\n  primary: blue\n"
+    )
+    with pytest.raises(CircularReferenceError, match="blue -> navy -> blue"):
+        Brand.from_yaml(path)
+
+
+def test_brand_from_trusted_dict():
+    brand = Brand.from_yaml(path_examples("brand-posit.yml"))
+
+    brand_trusted = Brand.from_trusted_dict(
+        {**brand.model_dump(), "path": brand.path}
+    )
+
+    assert brand_trusted == brand
+    assert brand_trusted.model_dump_yaml() == brand.model_dump_yaml()
+    assert isinstance(brand_trusted.typography, BrandTypography)
+
+
+def test_brand_from_trusted_dict_does_not_coerce():
+    brand = Brand.from_yaml(path_examples("brand-posit.yml"))
+    assert brand.meta is not None and brand.meta.link is not None
+    assert isinstance(brand.meta.link.home, HttpUrl)
+
+    # JSON-mode data isn't validated, so values aren't coerced back
+    brand_trusted = Brand.from_trusted_dict(
+        {**brand.model_dump(mode="json"), "path": brand.path}
+    )
+
+    assert brand_trusted != brand
+    assert brand_trusted.meta is not None
+    assert brand_trusted.meta.link is not None
+    assert brand_trusted.meta.link.home == "https://posit.co/"
+
+
+def test_brand_from_trusted_dict_resolves_colors():
+    brand = Brand.from_trusted_dict(
+        {
+            "color": {
+                "palette": {"blue": "#0000ff", "brand": "blue"},
+                "primary": "brand",
+            }
+        }
+    )
+
+    assert isinstance(brand.color, BrandColor)
+    assert brand.color.palette == {"blue": "#0000ff", "brand": "#0000ff"}
+    assert brand.color.primary == "#0000ff"
+    assert brand.color.to_dict("theme") == {"primary": "#0000ff"}
+
+
+def test_brand_from_trusted_dict_paths():
+    brand = Brand.from_yaml(path_fixtures / "path-resolution")
+    assert brand.path is not None
+
+    brand_trusted = Brand.from_trusted_dict(
+        {**brand.model_dump(), "path": brand.path}
+    )
+
+    assert isinstance(brand_trusted.logo, BrandLogo)
+    assert isinstance(brand_trusted.logo.small, BrandLogoResource)
+    assert isinstance(brand_trusted.logo.small.path, FileLocationLocal)
+    assert (
+        brand_trusted.logo.small.path.absolute()
+        == brand.path.parent / "does-not-exist.png"
+    )
+
+
+def test_brand_yml_paths_updates_nested_changes():
+    brand = Brand.from_yaml(path_fixtures / "path-resolution")
+    assert isinstance(brand.typography, BrandTypography)
+    assert isinstance(brand.typography.fonts, list)
+
+    # Modifying the brand in place isn't validated, but files added this way
+    # are still found when `brand.path` is updated
+    brand.typography.fonts.append(
+        BrandTypographyFontFiles(
+            family="Other",
+            files=[{"path": "b.woff2"}],  # type: ignore
+        )
+    )
+    brand.path = path_fixtures / "_brand.yml"
+
+    font = brand.typography.fonts[-1]
+    assert isinstance(font, BrandTypographyFontFiles)
+    assert isinstance(font.files[0].path, FileLocationLocal)
+    assert (
+        font.files[0].path.absolute() == (path_fixtures / "b.woff2").absolute()
+    )
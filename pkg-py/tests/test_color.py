@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import pytest
 from brand_yml import Brand, BrandColor
+from brand_yml._defs import CircularReferenceError
+from brand_yml.color import intern_hex_color, theme_color_fields
 from syrupy.extensions.json import JSONSnapshotExtension
 from utils import path_examples, pydantic_data_from_json
 
@@ -156,3 +158,133 @@ def test_brand_color_palette_names_valid_sass_vars():
     )
     assert isinstance(brand.color, BrandColor)
     assert brand.color.palette == {"my_pink": "#f0f"}
+
+
+def test_brand_color_to_dict_updates_on_assignment():
+    color = BrandColor(palette={"red": "#f00", "blue": "#00f"}, primary="red")
+    assert color.to_dict() == {"red": "#f00", "blue": "#00f", "primary": "#f00"}
+
+    # Returned dictionaries are copies of the cached definitions
+    color.to_dict()["primary"] = "#000"
+    assert color.to_dict(include="theme") == {"primary": "#f00"}
+
+    color.primary = "blue"
+    assert color.to_dict(include="theme") == {"primary": "#00f"}
+
+    # Cached definitions don't affect equality
+    assert color == BrandColor(
+        palette={"red": "#f00", "blue": "#00f"}, primary="blue"
+    )
+
+
+def test_brand_color_theme_fields():
+    theme_fields = [f for f in BrandColor.model_fields.keys() if f != "palette"]
+    assert list(theme_color_fields) == theme_fields
+
+    # `BrandColor` reads theme colors directly from the instance `__dict__`
+    color = BrandColor(primary="#0000ff")
+    assert all(field in vars(color) for field in theme_color_fields)
+    assert vars(color)["primary"] == "#0000ff"
+    assert vars(color)["secondary"] is None
+
+
+def test_brand_color_instance_shared_with_brand():
+    color = BrandColor(palette={"blue": "#0000ff"}, primary="blue")
+    colors = color.to_dict()
+    assert colors == {"blue": "#0000ff", "primary": "#0000ff"}
+
+    # The brand shares the existing instance and its resolved colors
+    brand = Brand(color=color, path=None)
+    assert brand.color is not None
+    assert brand.color is color
+    assert brand.color.to_dict() == colors
+
+    # Changes to the instance are seen by the brand, and assignment still
+    # validates and resolves colors
+    color.secondary = "blue"
+    assert color.secondary == "#0000ff"
+    assert brand.color.secondary == "#0000ff"
+
+    # Changes to the palette in place are picked up when the color is used again
+    assert color.palette is not None
+    color.palette["red"] = "#ff0000"
+    brand = Brand(color=color, path=None)
+    assert brand.color is not None
+    assert brand.color.to_dict("palette") == {
+        "blue": "#0000ff",
+        "red": "#ff0000",
+    }
+
+
+def test_brand_color_palette_circular_references():
+    with pytest.raises(CircularReferenceError, match="in 'palette'"):
+        BrandColor(palette={"a": "b", "b": "a"})
+
+    with pytest.raises(CircularReferenceError, match="in 'color'"):
+        BrandColor(palette={"a": "primary"}, primary="a")
+
+
+def test_brand_color_resolves_chained_references():
+    color = BrandColor(
+        palette={"blue": "#0000ff", "brand": "primary"},
+        primary="blue",
+        secondary="primary",
+        tertiary="brand",
+    )
+
+    assert color.primary == "#0000ff"
+    assert color.secondary == "#0000ff"
+    assert color.tertiary == "#0000ff"
+    assert color._resolved_defs()["brand"] == "#0000ff"
+
+    color.primary = "#ff0000"
+    assert color._resolved_defs()["brand"] == "#ff0000"
+
+
+def test_brand_color_palette_resolves_chains():
+    color = BrandColor(palette={"a": "b", "b": "c", "c": "#fff"}, primary="a")
+
+    assert color.palette == {"a": "#fff", "b": "#fff", "c": "#fff"}
+    assert color.primary == "#fff"
+
+
+def test_brand_color_interns_hex_colors():
+    hex_white = "".join(["#", "fff"])
+    color_one = BrandColor(palette={"white": hex_white}, background="white")
+    color_two = BrandColor(primary="".join(["#", "fff"]), secondary="red")
+
+    assert color_one.palette == {"white": "#fff"}
+    assert color_one.background == "#fff"
+    assert color_two.primary == "#fff"
+    assert color_two.secondary == "red"
+
+    assert intern_hex_color(hex_white) == "#fff"
+    # Other values are returned as they are
+    named = "".join(["r", "ed"])
+    assert intern_hex_color(named) is named
+
+
+def test_brand_color_to_dict_after_copy():
+    color = BrandColor(palette={"red": "#f00"}, primary="red")
+    assert color.to_dict("theme") == {"primary": "#f00"}
+
+    color_copy = color.model_copy(update={"primary": "#000"})
+    assert color_copy.primary == "#000"
+    assert color_copy.to_dict("theme") == {"primary": "#000"}
+    assert color.to_dict("theme") == {"primary": "#f00"}
+
+    color_deep = color.model_copy(update={"primary": "#111"}, deep=True)
+    assert color_deep.to_dict("theme") == {"primary": "#111"}
+
+
+def test_brand_color_to_dict_after_palette_modified_in_place():
+    color = BrandColor(palette={"red": "#f00"})
+    assert color.to_dict() == {"red": "#f00"}
+
+    assert color.palette is not None
+    color.palette["blue"] = "#00f"
+    assert color.to_dict() == {"red": "#f00", "blue": "#00f"}
+    assert color.to_dict("palette") == {"red": "#f00", "blue": "#00f"}
+
+    color.palette["red"] = "#e00"
+    assert color.to_dict() == {"red": "#e00", "blue": "#00f"}
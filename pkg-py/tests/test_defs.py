@@ -6,6 +6,8 @@ from brand_yml._defs import (
     check_circular_references,
     defs_get,
     defs_replace_recursively,
+    defs_resolve_flat,
+    skip_circular_reference_check,
 )
 from pydantic import BaseModel
 
@@ -22,11 +24,30 @@ def test_brand_with_errors_on_circular_references():
             {"a": "d", "b": "a", "d": {"x": "e", "y": {"y1": "b"}}}
         )
 
+    with pytest.raises(CircularReferenceError, match="a -> a"):
+        check_circular_references({"a": "a"})
+
+    with pytest.raises(
+        CircularReferenceError,
+        match="Refs    : d -> b -> d\nVia path: d -> y -> b",
+    ):
+        check_circular_references({"d": {"x": "e", "y": "b"}, "b": "d"})
+
     try:
         check_circular_references({"a": "b", "b": 2})
     except Exception:
         assert False, "should not raise an error "
 
+    with skip_circular_reference_check():
+        check_circular_references({"a": "b", "b": "a"})
+
+        # Resolving still detects circular references instead of looping
+        with pytest.raises(CircularReferenceError, match="a -> b -> a"):
+            defs_resolve_flat({"a": "b", "b": "a", "c": "#fff"})
+
+    with pytest.raises(CircularReferenceError):
+        check_circular_references({"a": "b", "b": "a"})
+
 
 class MyThing(BaseModel):
     a: str | int
@@ -62,3 +83,20 @@ def test_defs_replace_recursively():
     }
 
     assert defs_replace_recursively(None, {}) is None
+
+
+def test_defs_resolve_flat():
+    defs = {"a": "b", "b": "c", "c": "#fff", "d": "x"}
+
+    assert defs_resolve_flat(defs) == {
+        "a": "#fff",
+        "b": "#fff",
+        "c": "#fff",
+        "d": "x",
+    }
+    assert list(defs_resolve_flat(defs).keys()) == list(defs.keys())
+    # The original definitions are not modified
+    assert defs["a"] == "b"
+
+    with pytest.raises(CircularReferenceError, match="in 'test'"):
+        defs_resolve_flat({"a": "b", "b": "a"}, name="test")
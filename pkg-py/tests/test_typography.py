@@ -63,6 +63,15 @@ def test_validate_font_weight():
     assert validate_font_weight("thin") == 100
     assert validate_font_weight("semi-bold") == 600
 
+    assert validate_font_weight(400) == 400
+    assert validate_font_weight("700") == 700
+
+    with pytest.raises(ValueError):
+        validate_font_weight(450)
+
+    with pytest.raises(ValueError):
+        validate_font_weight(1000)
+
     with pytest.raises(ValueError):
         validate_font_weight("invalid")
 
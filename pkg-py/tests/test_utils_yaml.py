@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 from brand_yml import Brand
+from brand_yml._utils_yaml import yaml_load_data, yaml_load_file_entry
 
 
 def test_brand_model_dump_yaml(snapshot):
@@ -16,3 +19,40 @@ def test_brand_model_dump_yaml(snapshot):
     """)
 
     assert snapshot == brand.model_dump_yaml()
+
+
+def test_yaml_load_file_cache(tmp_path: Path):
+    path = tmp_path / "_brand.yml"
+    path.write_text("meta:\n  name: One\n")
+
+    entry = yaml_load_file_entry(path)
+    assert entry.data == {"meta": {"name": "One"}}
+    assert not entry.validated
+
+    # An unchanged file re-uses the cached entry
+    entry.validated = True
+    assert yaml_load_file_entry(path) is entry
+
+    # Changing the file invalidates the cached entry
+    path.write_text("meta:\n  name: Two, changed\n")
+    entry_changed = yaml_load_file_entry(path)
+    assert entry_changed.data == {"meta": {"name": "Two, changed"}}
+    assert not entry_changed.validated
+
+
+def test_yaml_load_data_yaml_1_2():
+    data = yaml_load_data("a: Yes\nb: on\nc: 012\nd: 1:30\ne: Off\n")
+    assert data == {"a": "Yes", "b": "on", "c": 12, "d": "1:30", "e": "Off"}
+
+    brand = Brand.from_yaml_str("""
+    meta:
+      name: Yes
+    color:
+      palette:
+        on: "#ff9a02"
+    """)
+    assert brand.meta is not None
+    assert brand.meta.name is not None
+    assert brand.meta.name.full == "Yes"
+    assert brand.color is not None
+    assert brand.color.palette == {"on": "#ff9a02"}